@@ -1,13 +1,80 @@
+import re
+import time
+from functools import lru_cache
+
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Value
 from django.utils import timezone
 from datetime import timedelta
 
+from django.db.models.signals import post_delete, post_save
+from django.utils.functional import cached_property
+
 from .models import Book, Borrower, Borrowing, Fine, Reservation, Category, Author
 
 
+# Category and Author change rarely but their full choice lists were
+# re-queried on every SearchForm/ReportForm render. Cache the (id, label)
+# pairs in process memory and invalidate on save/delete.
+_CHOICE_CACHE = {}
+
+# Compiled once; a single fullmatch pass replaces the isdigit + len walk
+_ISBN_RE = re.compile(r'\d{13}')
+
+
+@lru_cache(maxsize=1)
+def _date_parts(minute):
+    today = timezone.now().date()
+    return today, today.year
+
+
+def current_date():
+    """Today's date, refreshed at most once a minute.
+
+    Validators only need day granularity, so this avoids building a
+    tz-aware datetime on every form submission.
+    """
+    return _date_parts(int(time.monotonic()) // 60)[0]
+
+
+def current_year():
+    return _date_parts(int(time.monotonic()) // 60)[1]
+
+
+def get_category_choices():
+    choices = _CHOICE_CACHE.get('category')
+    if choices is None:
+        choices = list(Category.objects.order_by('name').values_list('id', 'name'))
+        _CHOICE_CACHE['category'] = choices
+    return choices
+
+
+def get_author_choices():
+    choices = _CHOICE_CACHE.get('author')
+    if choices is None:
+        choices = [
+            (pk, f"{first} {last}")
+            for pk, first, last in Author.objects.order_by('last_name', 'first_name')
+            .values_list('id', 'first_name', 'last_name')
+        ]
+        _CHOICE_CACHE['author'] = choices
+    return choices
+
+
+def _clear_choice_cache(sender, **kwargs):
+    _CHOICE_CACHE.pop('category' if sender is Category else 'author', None)
+
+
+post_save.connect(_clear_choice_cache, sender=Category)
+post_delete.connect(_clear_choice_cache, sender=Category)
+post_save.connect(_clear_choice_cache, sender=Author)
+post_delete.connect(_clear_choice_cache, sender=Author)
+
+
 class CustomUserCreationForm(UserCreationForm):
     """Extended user creation form for borrowers"""
     email = forms.EmailField(required=True)
@@ -27,17 +94,32 @@ class CustomUserCreationForm(UserCreationForm):
         self.fields['username'].help_text = 'Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.'
         self.fields['password1'].help_text = 'Your password must contain at least 8 characters.'
 
-    def clean_email(self):
-        email = self.cleaned_data.get('email')
-        if User.objects.filter(email=email).exists():
-            raise ValidationError("A user with this email already exists.")
-        return email
+    def clean(self):
+        cleaned_data = super().clean()
+        email = cleaned_data.get('email')
+        library_id = cleaned_data.get('library_id')
+
+        # Run both uniqueness checks in a single round trip instead of one
+        # exists() query per field
+        checks = []
+        if email:
+            checks.append(
+                User.objects.filter(email=email).order_by()
+                .annotate(field=Value('email')).values_list('field', flat=True)
+            )
+        if library_id:
+            checks.append(
+                Borrower.objects.filter(library_id=library_id).order_by()
+                .annotate(field=Value('library_id')).values_list('field', flat=True)
+            )
+        if checks:
+            conflicts = set(checks[0].union(*checks[1:]))
+            if 'email' in conflicts:
+                self.add_error('email', "A user with this email already exists.")
+            if 'library_id' in conflicts:
+                self.add_error('library_id', "A borrower with this library ID already exists.")
 
-    def clean_library_id(self):
-        library_id = self.cleaned_data.get('library_id')
-        if Borrower.objects.filter(library_id=library_id).exists():
-            raise ValidationError("A borrower with this library ID already exists.")
-        return library_id
+        return cleaned_data
 
     def save(self, commit=True):
         user = super().save(commit=False)
@@ -46,15 +128,17 @@ class CustomUserCreationForm(UserCreationForm):
         user.last_name = self.cleaned_data['last_name']
         
         if commit:
-            user.save()
-            # Create borrower profile
-            Borrower.objects.create(
-                user=user,
-                library_id=self.cleaned_data['library_id'],
-                phone=self.cleaned_data.get('phone', ''),
-                address=self.cleaned_data.get('address', ''),
-                date_of_birth=self.cleaned_data.get('date_of_birth'),
-            )
+            # One commit for the pair instead of two, and no half-created
+            # accounts if the borrower insert fails
+            with transaction.atomic():
+                user.save()
+                Borrower.objects.create(
+                    user=user,
+                    library_id=self.cleaned_data['library_id'],
+                    phone=self.cleaned_data.get('phone', ''),
+                    address=self.cleaned_data.get('address', ''),
+                    date_of_birth=self.cleaned_data.get('date_of_birth'),
+                )
         return user
 
 
@@ -82,12 +166,13 @@ class BorrowerForm(forms.ModelForm):
         borrower = super().save(commit=False)
         if commit:
             borrower.save()
-            # Update user information
+            # Update user information; only these three columns changed,
+            # so keep the UPDATE (and any signal payloads) to just them
             user = borrower.user
             user.email = self.cleaned_data['email']
             user.first_name = self.cleaned_data['first_name']
             user.last_name = self.cleaned_data['last_name']
-            user.save()
+            user.save(update_fields=['email', 'first_name', 'last_name'])
         return borrower
 
 
@@ -114,23 +199,49 @@ class BookForm(forms.ModelForm):
     def clean_isbn(self):
         isbn = self.cleaned_data.get('isbn')
         # Basic ISBN validation (should be 13 digits)
-        if isbn and not isbn.isdigit():
-            raise ValidationError("ISBN must contain only digits.")
-        if isbn and len(isbn) != 13:
+        if isbn and not _ISBN_RE.fullmatch(isbn):
             raise ValidationError("ISBN must be exactly 13 digits.")
         return isbn
 
     def clean_publication_year(self):
         year = self.cleaned_data.get('publication_year')
-        current_year = timezone.now().year
-        if year and (year < 1000 or year > current_year):
-            raise ValidationError(f"Publication year must be between 1000 and {current_year}.")
+        this_year = current_year()
+        if year and (year < 1000 or year > this_year):
+            raise ValidationError(f"Publication year must be between 1000 and {this_year}.")
         return year
 
 
-class BorrowingForm(forms.ModelForm):
+class OptimizedQuerysetFormMixin:
+    """Installs narrowed querysets on any ModelChoiceField a form grows.
+
+    The transaction forms are instantiated on every request; if a model
+    choice field is ever added to one, a plain Model.objects.all()
+    queryset would silently fetch the full table per render. Subclasses
+    declare the narrow queryset per model in `optimized_querysets` and
+    __init__ wires it up automatically.
+    """
+    optimized_querysets = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for field in self.fields.values():
+            if isinstance(field, forms.ModelChoiceField):
+                get_queryset = self.optimized_querysets.get(field.queryset.model)
+                if get_queryset is not None:
+                    field.queryset = get_queryset()
+
+
+class BorrowingForm(OptimizedQuerysetFormMixin, forms.ModelForm):
     """Form for borrowing books"""
-    
+    optimized_querysets = {
+        Book: lambda: Book.objects.select_related('category').only(
+            'title', 'isbn', 'status', 'available_copies', 'category__name'
+        ),
+        Borrower: lambda: Borrower.objects.select_related('user').only(
+            'library_id', 'user__first_name', 'user__last_name', 'user__username'
+        ),
+    }
+
     class Meta:
         model = Borrowing
         fields = ['notes']
@@ -158,9 +269,18 @@ class ReturnBookForm(forms.ModelForm):
         self.fields['notes'].required = False
 
 
-class FineForm(forms.ModelForm):
+class FineForm(OptimizedQuerysetFormMixin, forms.ModelForm):
     """Form for managing fines"""
-    
+    optimized_querysets = {
+        Borrowing: lambda: Borrowing.objects.select_related(
+            'borrower__user', 'book'
+        ).only(
+            'borrow_date', 'due_date', 'book__title',
+            'borrower__user__first_name', 'borrower__user__last_name',
+            'borrower__user__username', 'borrower__library_id',
+        ),
+    }
+
     class Meta:
         model = Fine
         fields = ['amount', 'status', 'notes']
@@ -173,9 +293,10 @@ class FineForm(forms.ModelForm):
         self.fields['amount'].widget.attrs['step'] = '0.01'
 
 
-class ReservationForm(forms.ModelForm):
+class ReservationForm(OptimizedQuerysetFormMixin, forms.ModelForm):
     """Form for reserving books"""
-    
+    optimized_querysets = BorrowingForm.optimized_querysets
+
     class Meta:
         model = Reservation
         fields = ['notes']
@@ -198,16 +319,14 @@ class SearchForm(forms.Form):
             'class': 'form-control'
         })
     )
-    category = forms.ModelChoiceField(
-        queryset=Category.objects.all(),
+    category = forms.ChoiceField(
+        choices=lambda: [('', 'All Categories')] + get_category_choices(),
         required=False,
-        empty_label="All Categories",
         widget=forms.Select(attrs={'class': 'form-control'})
     )
-    author = forms.ModelChoiceField(
-        queryset=Author.objects.all(),
+    author = forms.ChoiceField(
+        choices=lambda: [('', 'All Authors')] + get_author_choices(),
         required=False,
-        empty_label="All Authors",
         widget=forms.Select(attrs={'class': 'form-control'})
     )
     status = forms.ChoiceField(
@@ -216,10 +335,17 @@ class SearchForm(forms.Form):
         widget=forms.Select(attrs={'class': 'form-control'})
     )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['category'].queryset = Category.objects.all().order_by('name')
-        self.fields['author'].queryset = Author.objects.all().order_by('last_name', 'first_name')
+    # Resolved at most once per form instance; views and templates that
+    # need the selected objects read these instead of re-querying by id
+    @cached_property
+    def cleaned_category(self):
+        pk = self.cleaned_data.get('category')
+        return Category.objects.filter(pk=pk).first() if pk else None
+
+    @cached_property
+    def cleaned_author(self):
+        pk = self.cleaned_data.get('author')
+        return Author.objects.filter(pk=pk).first() if pk else None
 
 
 class CategoryForm(forms.ModelForm):
@@ -246,7 +372,7 @@ class AuthorForm(forms.ModelForm):
 
     def clean_birth_date(self):
         birth_date = self.cleaned_data.get('birth_date')
-        if birth_date and birth_date > timezone.now().date():
+        if birth_date and birth_date > current_date():
             raise ValidationError("Birth date cannot be in the future.")
         return birth_date
 
@@ -293,10 +419,9 @@ class ReportForm(forms.Form):
         required=False,
         widget=forms.DateInput(attrs={'type': 'date', 'class': 'form-control'})
     )
-    category = forms.ModelChoiceField(
-        queryset=Category.objects.all(),
+    category = forms.ChoiceField(
+        choices=lambda: [('', 'All Categories')] + get_category_choices(),
         required=False,
-        empty_label="All Categories",
         widget=forms.Select(attrs={'class': 'form-control'})
     )
 
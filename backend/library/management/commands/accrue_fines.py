@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from library.models import Borrowing, Fine
+
+
+class Command(BaseCommand):
+    help = 'Create pending fines for overdue borrowings without one'
+
+    def handle(self, *args, **options):
+        # One query finds every overdue borrowing that has no fine yet;
+        # ignore_conflicts makes concurrent runs safe since borrowing is
+        # unique on Fine
+        candidates = Borrowing.objects.filter(
+            return_date__isnull=True,
+            due_date__lt=timezone.now(),
+            fine__isnull=True,
+        )
+        new_fines = [
+            Fine(borrowing=borrowing, amount=borrowing.fine_amount)
+            for borrowing in candidates.iterator(chunk_size=500)
+            if borrowing.fine_amount > 0
+        ]
+        Fine.objects.bulk_create(new_fines, batch_size=500, ignore_conflicts=True)
+        self.stdout.write(self.style.SUCCESS(f'Created {len(new_fines)} fines.'))
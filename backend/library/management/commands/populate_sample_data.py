@@ -1,349 +1,478 @@
+from collections import Counter
+
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 from library.models import Category, Author, Book, Borrower, Borrowing, Fine
 
 
+# The sample fixtures are immutable; keep them at module scope so repeated
+# call_command() invocations (e.g. from tests) don't rebuild ~40 dicts per run
+_CATEGORIES = (
+    {'name': 'Fiction', 'description': 'Novels, short stories, and other fictional works'},
+    {'name': 'Non-Fiction', 'description': 'Biographies, history, science, and other factual works'},
+    {'name': 'Science Fiction', 'description': 'Science fiction and fantasy novels'},
+    {'name': 'Mystery', 'description': 'Mystery and thriller novels'},
+    {'name': 'Romance', 'description': 'Romance novels and love stories'},
+    {'name': 'Biography', 'description': 'Biographical works and memoirs'},
+    {'name': 'History', 'description': 'Historical works and accounts'},
+    {'name': 'Science', 'description': 'Scientific works and textbooks'},
+    {'name': 'Technology', 'description': 'Computer science and technology books'},
+    {'name': 'Philosophy', 'description': 'Philosophical works and theories'},
+)
+
+_AUTHORS = (
+    {'first_name': 'George', 'last_name': 'Orwell', 'bio': 'English novelist and essayist'},
+    {'first_name': 'Harper', 'last_name': 'Lee', 'bio': 'American novelist'},
+    {'first_name': 'F. Scott', 'last_name': 'Fitzgerald', 'bio': 'American novelist and short story writer'},
+    {'first_name': 'Jane', 'last_name': 'Austen', 'bio': 'English novelist'},
+    {'first_name': 'Mark', 'last_name': 'Twain', 'bio': 'American writer and humorist'},
+    {'first_name': 'Charles', 'last_name': 'Dickens', 'bio': 'English writer and social critic'},
+    {'first_name': 'J.K.', 'last_name': 'Rowling', 'bio': 'British author, best known for Harry Potter series'},
+    {'first_name': 'Stephen', 'last_name': 'King', 'bio': 'American author of horror, supernatural fiction'},
+    {'first_name': 'Isaac', 'last_name': 'Asimov', 'bio': 'American writer and professor of biochemistry'},
+    {'first_name': 'Arthur C.', 'last_name': 'Clarke', 'bio': 'British science fiction writer'},
+)
+
+_BOOKS = (
+    {
+        'title': '1984',
+        'isbn': '9780451524935',
+        'authors': ['George Orwell'],
+        'category': 'Fiction',
+        'publisher': 'Signet Classics',
+        'publication_year': 1949,
+        'pages': 328,
+        'description': 'A dystopian social science fiction novel about totalitarian control.',
+        'total_copies': 3,
+        'available_copies': 2,
+    },
+    {
+        'title': 'To Kill a Mockingbird',
+        'isbn': '9780061120084',
+        'authors': ['Harper Lee'],
+        'category': 'Fiction',
+        'publisher': 'Harper Perennial',
+        'publication_year': 1960,
+        'pages': 376,
+        'description': 'A novel about racial injustice and childhood innocence.',
+        'total_copies': 2,
+        'available_copies': 1,
+    },
+    {
+        'title': 'The Great Gatsby',
+        'isbn': '9780743273565',
+        'authors': ['F. Scott Fitzgerald'],
+        'category': 'Fiction',
+        'publisher': 'Scribner',
+        'publication_year': 1925,
+        'pages': 180,
+        'description': 'A novel about the American Dream and social class.',
+        'total_copies': 4,
+        'available_copies': 3,
+    },
+    {
+        'title': 'Pride and Prejudice',
+        'isbn': '9780141439518',
+        'authors': ['Jane Austen'],
+        'category': 'Romance',
+        'publisher': 'Penguin Classics',
+        'publication_year': 1813,
+        'pages': 432,
+        'description': 'A romantic novel about Elizabeth Bennet and Mr. Darcy.',
+        'total_copies': 3,
+        'available_copies': 2,
+    },
+    {
+        'title': 'The Adventures of Tom Sawyer',
+        'isbn': '9780486400778',
+        'authors': ['Mark Twain'],
+        'category': 'Fiction',
+        'publisher': 'Dover Publications',
+        'publication_year': 1876,
+        'pages': 224,
+        'description': 'A novel about a young boy growing up along the Mississippi River.',
+        'total_copies': 2,
+        'available_copies': 1,
+    },
+    {
+        'title': 'A Tale of Two Cities',
+        'isbn': '9780486406510',
+        'authors': ['Charles Dickens'],
+        'category': 'Fiction',
+        'publisher': 'Dover Publications',
+        'publication_year': 1859,
+        'pages': 304,
+        'description': 'A novel set during the French Revolution.',
+        'total_copies': 2,
+        'available_copies': 2,
+    },
+    {
+        'title': 'Harry Potter and the Philosopher\'s Stone',
+        'isbn': '9780747532699',
+        'authors': ['J.K. Rowling'],
+        'category': 'Fiction',
+        'publisher': 'Bloomsbury',
+        'publication_year': 1997,
+        'pages': 223,
+        'description': 'The first book in the Harry Potter series.',
+        'total_copies': 5,
+        'available_copies': 3,
+    },
+    {
+        'title': 'The Shining',
+        'isbn': '9780307743657',
+        'authors': ['Stephen King'],
+        'category': 'Mystery',
+        'publisher': 'Anchor',
+        'publication_year': 1977,
+        'pages': 688,
+        'description': 'A horror novel about a haunted hotel.',
+        'total_copies': 3,
+        'available_copies': 2,
+    },
+    {
+        'title': 'Foundation',
+        'isbn': '9780553293357',
+        'authors': ['Isaac Asimov'],
+        'category': 'Science Fiction',
+        'publisher': 'Spectra',
+        'publication_year': 1951,
+        'pages': 244,
+        'description': 'The first book in the Foundation series.',
+        'total_copies': 2,
+        'available_copies': 1,
+    },
+    {
+        'title': '2001: A Space Odyssey',
+        'isbn': '9780451457998',
+        'authors': ['Arthur C. Clarke'],
+        'category': 'Science Fiction',
+        'publisher': 'Ace',
+        'publication_year': 1968,
+        'pages': 221,
+        'description': 'A science fiction novel about human evolution and space exploration.',
+        'total_copies': 3,
+        'available_copies': 2,
+    },
+)
+
+_USERS = (
+    {
+        'username': 'john_doe',
+        'email': 'john.doe@example.com',
+        'first_name': 'John',
+        'last_name': 'Doe',
+        'library_id': 'LIB001',
+        'phone': '(555) 123-4567',
+    },
+    {
+        'username': 'jane_smith',
+        'email': 'jane.smith@example.com',
+        'first_name': 'Jane',
+        'last_name': 'Smith',
+        'library_id': 'LIB002',
+        'phone': '(555) 234-5678',
+    },
+    {
+        'username': 'mike_wilson',
+        'email': 'mike.wilson@example.com',
+        'first_name': 'Mike',
+        'last_name': 'Wilson',
+        'library_id': 'LIB003',
+        'phone': '(555) 345-6789',
+    },
+    {
+        'username': 'sarah_jones',
+        'email': 'sarah.jones@example.com',
+        'first_name': 'Sarah',
+        'last_name': 'Jones',
+        'library_id': 'LIB004',
+        'phone': '(555) 456-7890',
+    },
+)
+
+_BORROWINGS = (
+    {
+        'borrower': 'john_doe',
+        'book': 'To Kill a Mockingbird',
+        'days_ago': 5,
+        'due_days': 9,
+    },
+    {
+        'borrower': 'jane_smith',
+        'book': '1984',
+        'days_ago': 10,
+        'due_days': 4,
+    },
+    {
+        'borrower': 'mike_wilson',
+        'book': 'The Great Gatsby',
+        'days_ago': 15,
+        'due_days': -1,  # Overdue
+    },
+    {
+        'borrower': 'sarah_jones',
+        'book': 'Harry Potter and the Philosopher\'s Stone',
+        'days_ago': 3,
+        'due_days': 11,
+    },
+)
+
+
 class Command(BaseCommand):
     help = 'Populate the database with sample data'
 
     def handle(self, *args, **options):
-        self.stdout.write('Creating sample data...')
+        # Commit all the seed writes as one transaction instead of one
+        # autocommit (and fsync) per statement
+        with transaction.atomic():
+            self._populate()
 
-        # Create categories
-        categories_data = [
-            {'name': 'Fiction', 'description': 'Novels, short stories, and other fictional works'},
-            {'name': 'Non-Fiction', 'description': 'Biographies, history, science, and other factual works'},
-            {'name': 'Science Fiction', 'description': 'Science fiction and fantasy novels'},
-            {'name': 'Mystery', 'description': 'Mystery and thriller novels'},
-            {'name': 'Romance', 'description': 'Romance novels and love stories'},
-            {'name': 'Biography', 'description': 'Biographical works and memoirs'},
-            {'name': 'History', 'description': 'Historical works and accounts'},
-            {'name': 'Science', 'description': 'Scientific works and textbooks'},
-            {'name': 'Technology', 'description': 'Computer science and technology books'},
-            {'name': 'Philosophy', 'description': 'Philosophical works and theories'},
-        ]
+    def _populate(self):
+        # Buffer progress lines and emit them in one write at the end
+        # instead of a flushed write per created row
+        lines = ['Creating sample data...']
 
-        categories = {}
-        for cat_data in categories_data:
-            category, created = Category.objects.get_or_create(
-                name=cat_data['name'],
-                defaults={'description': cat_data['description']}
-            )
-            categories[cat_data['name']] = category
-            if created:
-                self.stdout.write(f'Created category: {category.name}')
+        # Categories, authors and users have no FK dependency on each
+        # other. They are split into their own helpers so a Postgres
+        # deployment could fan them out over per-thread connections; on
+        # this SQLite backend writes are serialized and everything runs
+        # inside one transaction, so they are simply called in sequence.
+        categories = self._seed_categories(lines)
+        author_id_by_name = self._seed_authors(lines)
+        users = self._seed_users(lines)
 
-        # Create authors
-        authors_data = [
-            {'first_name': 'George', 'last_name': 'Orwell', 'bio': 'English novelist and essayist'},
-            {'first_name': 'Harper', 'last_name': 'Lee', 'bio': 'American novelist'},
-            {'first_name': 'F. Scott', 'last_name': 'Fitzgerald', 'bio': 'American novelist and short story writer'},
-            {'first_name': 'Jane', 'last_name': 'Austen', 'bio': 'English novelist'},
-            {'first_name': 'Mark', 'last_name': 'Twain', 'bio': 'American writer and humorist'},
-            {'first_name': 'Charles', 'last_name': 'Dickens', 'bio': 'English writer and social critic'},
-            {'first_name': 'J.K.', 'last_name': 'Rowling', 'bio': 'British author, best known for Harry Potter series'},
-            {'first_name': 'Stephen', 'last_name': 'King', 'bio': 'American author of horror, supernatural fiction'},
-            {'first_name': 'Isaac', 'last_name': 'Asimov', 'bio': 'American writer and professor of biochemistry'},
-            {'first_name': 'Arthur C.', 'last_name': 'Clarke', 'bio': 'British science fiction writer'},
-        ]
+        books = self._seed_books(lines, categories, author_id_by_name)
+        self._seed_borrowings_and_fines(lines, users, books)
 
-        authors = {}
-        for author_data in authors_data:
-            author, created = Author.objects.get_or_create(
-                first_name=author_data['first_name'],
-                last_name=author_data['last_name'],
-                defaults={'bio': author_data['bio']}
-            )
-            authors[f"{author_data['first_name']} {author_data['last_name']}"] = author
-            if created:
-                self.stdout.write(f'Created author: {author.full_name}')
+        lines.append(self.style.SUCCESS('Successfully created sample data!'))
+        lines.append('Sample login credentials:')
+        lines.append('Username: john_doe, Password: password123')
+        lines.append('Username: jane_smith, Password: password123')
+        lines.append('Username: mike_wilson, Password: password123')
+        lines.append('Username: sarah_jones, Password: password123')
+        self.stdout.write('\n'.join(lines))
 
-        # Create books
-        books_data = [
-            {
-                'title': '1984',
-                'isbn': '9780451524935',
-                'authors': ['George Orwell'],
-                'category': 'Fiction',
-                'publisher': 'Signet Classics',
-                'publication_year': 1949,
-                'pages': 328,
-                'description': 'A dystopian social science fiction novel about totalitarian control.',
-                'total_copies': 3,
-                'available_copies': 2,
-            },
-            {
-                'title': 'To Kill a Mockingbird',
-                'isbn': '9780061120084',
-                'authors': ['Harper Lee'],
-                'category': 'Fiction',
-                'publisher': 'Harper Perennial',
-                'publication_year': 1960,
-                'pages': 376,
-                'description': 'A novel about racial injustice and childhood innocence.',
-                'total_copies': 2,
-                'available_copies': 1,
-            },
-            {
-                'title': 'The Great Gatsby',
-                'isbn': '9780743273565',
-                'authors': ['F. Scott Fitzgerald'],
-                'category': 'Fiction',
-                'publisher': 'Scribner',
-                'publication_year': 1925,
-                'pages': 180,
-                'description': 'A novel about the American Dream and social class.',
-                'total_copies': 4,
-                'available_copies': 3,
-            },
-            {
-                'title': 'Pride and Prejudice',
-                'isbn': '9780141439518',
-                'authors': ['Jane Austen'],
-                'category': 'Romance',
-                'publisher': 'Penguin Classics',
-                'publication_year': 1813,
-                'pages': 432,
-                'description': 'A romantic novel about Elizabeth Bennet and Mr. Darcy.',
-                'total_copies': 3,
-                'available_copies': 2,
-            },
-            {
-                'title': 'The Adventures of Tom Sawyer',
-                'isbn': '9780486400778',
-                'authors': ['Mark Twain'],
-                'category': 'Fiction',
-                'publisher': 'Dover Publications',
-                'publication_year': 1876,
-                'pages': 224,
-                'description': 'A novel about a young boy growing up along the Mississippi River.',
-                'total_copies': 2,
-                'available_copies': 1,
-            },
-            {
-                'title': 'A Tale of Two Cities',
-                'isbn': '9780486406510',
-                'authors': ['Charles Dickens'],
-                'category': 'Fiction',
-                'publisher': 'Dover Publications',
-                'publication_year': 1859,
-                'pages': 304,
-                'description': 'A novel set during the French Revolution.',
-                'total_copies': 2,
-                'available_copies': 2,
-            },
-            {
-                'title': 'Harry Potter and the Philosopher\'s Stone',
-                'isbn': '9780747532699',
-                'authors': ['J.K. Rowling'],
-                'category': 'Fiction',
-                'publisher': 'Bloomsbury',
-                'publication_year': 1997,
-                'pages': 223,
-                'description': 'The first book in the Harry Potter series.',
-                'total_copies': 5,
-                'available_copies': 3,
-            },
-            {
-                'title': 'The Shining',
-                'isbn': '9780307743657',
-                'authors': ['Stephen King'],
-                'category': 'Mystery',
-                'publisher': 'Anchor',
-                'publication_year': 1977,
-                'pages': 688,
-                'description': 'A horror novel about a haunted hotel.',
-                'total_copies': 3,
-                'available_copies': 2,
-            },
-            {
-                'title': 'Foundation',
-                'isbn': '9780553293357',
-                'authors': ['Isaac Asimov'],
-                'category': 'Science Fiction',
-                'publisher': 'Spectra',
-                'publication_year': 1951,
-                'pages': 244,
-                'description': 'The first book in the Foundation series.',
-                'total_copies': 2,
-                'available_copies': 1,
-            },
-            {
-                'title': '2001: A Space Odyssey',
-                'isbn': '9780451457998',
-                'authors': ['Arthur C. Clarke'],
-                'category': 'Science Fiction',
-                'publisher': 'Ace',
-                'publication_year': 1968,
-                'pages': 221,
-                'description': 'A science fiction novel about human evolution and space exploration.',
-                'total_copies': 3,
-                'available_copies': 2,
-            },
-        ]
+    def _seed_categories(self, lines):
+        # Load the existing rows once, insert the missing ones in a single
+        # statement, then refetch to pick up the generated pks
+        category_names = [d['name'] for d in _CATEGORIES]
+        existing_names = set(
+            Category.objects.filter(name__in=category_names)
+            .values_list('name', flat=True)
+        )
+        Category.objects.bulk_create(
+            [Category(**d) for d in _CATEGORIES if d['name'] not in existing_names],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+        categories = {
+            c.name: c for c in Category.objects.filter(name__in=category_names)
+        }
+        for name in category_names:
+            if name not in existing_names:
+                lines.append(f'Created category: {name}')
+        return categories
 
-        books = {}
-        for book_data in books_data:
-            book, created = Book.objects.get_or_create(
-                isbn=book_data['isbn'],
-                defaults={
-                    'title': book_data['title'],
-                    'category': categories[book_data['category']],
-                    'publisher': book_data['publisher'],
-                    'publication_year': book_data['publication_year'],
-                    'pages': book_data['pages'],
-                    'description': book_data['description'],
-                    'total_copies': book_data['total_copies'],
-                    'available_copies': book_data['available_copies'],
-                }
+    def _seed_authors(self, lines):
+        author_keys = {(d['first_name'], d['last_name']) for d in _AUTHORS}
+        existing_authors = {
+            (a.first_name, a.last_name)
+            for a in Author.objects.filter(
+                first_name__in=[k[0] for k in author_keys],
+                last_name__in=[k[1] for k in author_keys],
             )
-            if created:
-                # Add authors
-                for author_name in book_data['authors']:
-                    if author_name in authors:
-                        book.authors.add(authors[author_name])
-                books[book_data['title']] = book
-                self.stdout.write(f'Created book: {book.title}')
-
-        # Create sample users and borrowers
-        users_data = [
-            {
-                'username': 'john_doe',
-                'email': 'john.doe@example.com',
-                'first_name': 'John',
-                'last_name': 'Doe',
-                'library_id': 'LIB001',
-                'phone': '(555) 123-4567',
-            },
-            {
-                'username': 'jane_smith',
-                'email': 'jane.smith@example.com',
-                'first_name': 'Jane',
-                'last_name': 'Smith',
-                'library_id': 'LIB002',
-                'phone': '(555) 234-5678',
-            },
-            {
-                'username': 'mike_wilson',
-                'email': 'mike.wilson@example.com',
-                'first_name': 'Mike',
-                'last_name': 'Wilson',
-                'library_id': 'LIB003',
-                'phone': '(555) 345-6789',
-            },
-            {
-                'username': 'sarah_jones',
-                'email': 'sarah.jones@example.com',
-                'first_name': 'Sarah',
-                'last_name': 'Jones',
-                'library_id': 'LIB004',
-                'phone': '(555) 456-7890',
-            },
-        ]
+        }
+        Author.objects.bulk_create(
+            [
+                Author(**d) for d in _AUTHORS
+                if (d['first_name'], d['last_name']) not in existing_authors
+            ],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+        # Only the pks are needed downstream (through-table rows), so skip
+        # materializing Author instances for the refetch
+        author_id_by_name = {
+            f"{first} {last}": pk
+            for first, last, pk in Author.objects.filter(
+                first_name__in=[k[0] for k in author_keys],
+                last_name__in=[k[1] for k in author_keys],
+            ).values_list('first_name', 'last_name', 'id')
+        }
+        for first_name, last_name in author_keys - existing_authors:
+            lines.append(f'Created author: {first_name} {last_name}')
+        return author_id_by_name
 
-        borrowers = {}
-        for user_data in users_data:
-            user, created = User.objects.get_or_create(
+    def _seed_users(self, lines):
+        usernames = [u['username'] for u in _USERS]
+        existing_users = User.objects.in_bulk(usernames, field_name='username')
+        # All sample users share the default password, so pay the
+        # (deliberately slow) hash once rather than per user
+        sample_password = make_password('password123')
+        new_users = [
+            User(
                 username=user_data['username'],
-                defaults={
-                    'email': user_data['email'],
-                    'first_name': user_data['first_name'],
-                    'last_name': user_data['last_name'],
-                }
+                email=user_data['email'],
+                first_name=user_data['first_name'],
+                last_name=user_data['last_name'],
+                password=sample_password,
             )
-            if created:
-                user.set_password('password123')  # Default password
-                user.save()
+            for user_data in _USERS
+            if user_data['username'] not in existing_users
+        ]
+        User.objects.bulk_create(new_users, ignore_conflicts=True, batch_size=500)
+        return User.objects.in_bulk(usernames, field_name='username')
 
-            borrower, created = Borrower.objects.get_or_create(
-                user=user,
-                defaults={
-                    'library_id': user_data['library_id'],
-                    'phone': user_data['phone'],
-                    'is_active': True,
-                }
-            )
-            borrowers[user_data['username']] = borrower
-            if created:
-                self.stdout.write(f'Created borrower: {borrower.full_name}')
+    def _seed_books(self, lines, categories, author_id_by_name):
+        isbns = [d['isbn'] for d in _BOOKS]
+        existing_isbns = set(
+            Book.objects.filter(isbn__in=isbns).values_list('isbn', flat=True)
+        )
+        Book.objects.bulk_create(
+            [
+                Book(
+                    title=book_data['title'],
+                    isbn=book_data['isbn'],
+                    category=categories[book_data['category']],
+                    publisher=book_data['publisher'],
+                    publication_year=book_data['publication_year'],
+                    pages=book_data['pages'],
+                    description=book_data['description'],
+                    total_copies=book_data['total_copies'],
+                    available_copies=book_data['available_copies'],
+                )
+                for book_data in _BOOKS
+                if book_data['isbn'] not in existing_isbns
+            ],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+        book_id_by_isbn = dict(
+            Book.objects.filter(isbn__in=isbns).values_list('isbn', 'id')
+        )
+
+        # Attach all authors with one INSERT into the through table
+        # instead of one authors.add() round trip per book; the id maps
+        # mean no Book or Author instances are materialized here at all
+        Book.authors.through.objects.bulk_create(
+            [
+                Book.authors.through(
+                    book_id=book_id_by_isbn[book_data['isbn']],
+                    author_id=author_id_by_name[author_name],
+                )
+                for book_data in _BOOKS
+                if book_data['isbn'] not in existing_isbns
+                for author_name in book_data['authors']
+                if author_name in author_id_by_name
+            ],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+
+        # The borrowings section mutates available_copies, so it needs
+        # real instances -- for every seed book, not just the ones
+        # created this run, or re-runs crash on the title lookup
+        books = {b.title: b for b in Book.objects.filter(isbn__in=isbns)}
+        for book_data in _BOOKS:
+            if book_data['isbn'] not in existing_isbns:
+                lines.append(f'Created book: {book_data["title"]}')
+        return books
+
+    def _seed_borrowings_and_fines(self, lines, users, books):
+        existing_borrower_user_ids = set(
+            Borrower.objects.filter(user__in=users.values())
+            .values_list('user_id', flat=True)
+        )
+        Borrower.objects.bulk_create(
+            [
+                Borrower(
+                    user=users[user_data['username']],
+                    library_id=user_data['library_id'],
+                    phone=user_data['phone'],
+                    is_active=True,
+                )
+                for user_data in _USERS
+                if users[user_data['username']].id not in existing_borrower_user_ids
+            ],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+        borrowers = {
+            b.user.username: b
+            for b in Borrower.objects.filter(user__in=users.values()).select_related('user')
+        }
+        for user_data in _USERS:
+            if users[user_data['username']].id not in existing_borrower_user_ids:
+                lines.append(
+                    f'Created borrower: {borrowers[user_data["username"]].full_name}'
+                )
 
         # Create some sample borrowings
-        borrowings_data = [
-            {
-                'borrower': 'john_doe',
-                'book': 'To Kill a Mockingbird',
-                'days_ago': 5,
-                'due_days': 9,
-            },
-            {
-                'borrower': 'jane_smith',
-                'book': '1984',
-                'days_ago': 10,
-                'due_days': 4,
-            },
-            {
-                'borrower': 'mike_wilson',
-                'book': 'The Great Gatsby',
-                'days_ago': 15,
-                'due_days': -1,  # Overdue
-            },
-            {
-                'borrower': 'sarah_jones',
-                'book': 'Harry Potter and the Philosopher\'s Stone',
-                'days_ago': 3,
-                'due_days': 11,
-            },
-        ]
+        # Figure out which sample borrowings are missing with one preload
+        # query, then write the availability deltas and the borrowings in
+        # one bulk_update + one bulk_create instead of a read-modify-write
+        # save pair per row
+        # Keyed on (borrower, book) only: borrow_date is auto_now_add, so
+        # the stored value is the creation time, never the seed date
+        existing_borrowings = set(
+            Borrowing.objects.filter(
+                borrower__in=borrowers.values(),
+                book__in=books.values(),
+            ).values_list('borrower_id', 'book_id')
+        )
 
-        for borrowing_data in borrowings_data:
+        new_borrowings = []
+        deltas = Counter()
+        for borrowing_data in _BORROWINGS:
             borrower = borrowers[borrowing_data['borrower']]
             book = books[borrowing_data['book']]
-            
-            # Update book availability
-            book.available_copies -= 1
-            book.save()
-
             borrow_date = timezone.now() - timedelta(days=borrowing_data['days_ago'])
-            due_date = borrow_date + timedelta(days=14)
-            
-            borrowing, created = Borrowing.objects.get_or_create(
+            if (borrower.id, book.id) in existing_borrowings:
+                continue
+            deltas[book.id] += 1
+            new_borrowings.append(Borrowing(
                 borrower=borrower,
                 book=book,
-                borrow_date__date=borrow_date.date(),
-                defaults={
-                    'borrow_date': borrow_date,
-                    'due_date': due_date,
-                    'status': 'borrowed',
-                }
+                borrow_date=borrow_date,
+                due_date=borrow_date + timedelta(days=14),
+                status='borrowed',
+            ))
+
+        changed_books = []
+        for book in books.values():
+            if deltas[book.id]:
+                book.available_copies -= deltas[book.id]
+                changed_books.append(book)
+        Book.objects.bulk_update(changed_books, ['available_copies'], batch_size=500)
+
+        Borrowing.objects.bulk_create(new_borrowings, batch_size=500)
+        for borrowing in new_borrowings:
+            lines.append(
+                f'Created borrowing: {borrowing.borrower.full_name} - {borrowing.book.title}'
             )
-            
-            if created:
-                self.stdout.write(f'Created borrowing: {borrower.full_name} - {book.title}')
 
-        # Create some fines for overdue books
+        # Create some fines for overdue books. Exclude borrowings that
+        # already have one and insert the rest in a single statement;
+        # select_related covers the borrower name in the log line.
+        existing_fine_ids = set(Fine.objects.values_list('borrowing_id', flat=True))
         overdue_borrowings = Borrowing.objects.filter(
             return_date__isnull=True,
             due_date__lt=timezone.now()
-        )
-        
-        for borrowing in overdue_borrowings:
-            fine, created = Fine.objects.get_or_create(
-                borrowing=borrowing,
-                defaults={
-                    'amount': borrowing.fine_amount,
-                    'status': 'pending',
-                }
-            )
-            if created:
-                self.stdout.write(f'Created fine: ${fine.amount} for {borrowing.borrower.full_name}')
+        ).exclude(id__in=existing_fine_ids).select_related('borrower__user', 'book')
 
-        self.stdout.write(
-            self.style.SUCCESS('Successfully created sample data!')
-        )
-        self.stdout.write('Sample login credentials:')
-        self.stdout.write('Username: john_doe, Password: password123')
-        self.stdout.write('Username: jane_smith, Password: password123')
-        self.stdout.write('Username: mike_wilson, Password: password123')
-        self.stdout.write('Username: sarah_jones, Password: password123')
+        # Stream with a server-side cursor so a large overdue backlog
+        # doesn't get materialized (and result-cached) in memory at once
+        new_fines = [
+            Fine(borrowing=borrowing, amount=borrowing.fine_amount, status='pending')
+            for borrowing in overdue_borrowings.iterator(chunk_size=500)
+        ]
+        Fine.objects.bulk_create(new_fines, ignore_conflicts=True, batch_size=500)
+        for fine in new_fines:
+            lines.append(
+                f'Created fine: ${fine.amount} for {fine.borrowing.borrower.full_name}'
+            )
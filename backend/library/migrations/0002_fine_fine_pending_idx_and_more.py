@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-08-26 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fine',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['status'], name='fine_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['status'], name='reservation_pending_idx'),
+        ),
+    ]
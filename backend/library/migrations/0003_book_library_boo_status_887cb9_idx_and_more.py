@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-08-26 14:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0002_fine_fine_pending_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['status', 'available_copies'], name='library_boo_status_887cb9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='borrowing',
+            index=models.Index(fields=['return_date', 'due_date'], name='library_bor_return__b9df3d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='borrowing',
+            index=models.Index(fields=['borrower', 'return_date'], name='library_bor_borrowe_a5a49b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='borrowing',
+            index=models.Index(condition=models.Q(('return_date__isnull', True)), fields=['due_date'], name='brw_overdue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['status', 'expiry_date'], name='library_res_status_05e98c_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-26 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0003_book_library_boo_status_887cb9_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='borrowing',
+            index=models.Index(fields=['borrow_date'], name='library_bor_borrow__0e5e19_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-26 14:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0004_borrowing_library_bor_borrow__0e5e19_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='book',
+            constraint=models.CheckConstraint(check=models.Q(('available_copies__lte', models.F('total_copies'))), name='available_le_total'),
+        ),
+    ]
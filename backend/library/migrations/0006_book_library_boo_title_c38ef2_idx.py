@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-26 14:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0005_book_available_le_total'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['title'], name='library_boo_title_c38ef2_idx'),
+        ),
+    ]
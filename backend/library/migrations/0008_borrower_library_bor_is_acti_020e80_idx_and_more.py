@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-08-26 14:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0007_book_library_boo_status_552711_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='borrower',
+            index=models.Index(fields=['is_active'], name='library_bor_is_acti_020e80_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fine',
+            index=models.Index(fields=['status', 'amount'], name='library_fin_status_722fda_idx'),
+        ),
+    ]
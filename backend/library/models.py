@@ -1,10 +1,18 @@
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Case, F, Q, Value, When
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
 from datetime import timedelta
 from django.conf import settings
 
+# Fine policy is fixed for the process lifetime; resolve the settings
+# once instead of two getattr lookups per fine_amount call
+_DAILY_FINE_RATE = getattr(settings, 'DAILY_FINE_RATE', 5.0)
+_MAX_FINE_DAYS = getattr(settings, 'MAX_FINE_DAYS', 30)
+
 
 class Category(models.Model):
     """Book categories for better organization"""
@@ -67,21 +75,41 @@ class Book(models.Model):
 
     class Meta:
         ordering = ['title']
+        indexes = [
+            # is_available-style filters hit (status, available_copies)
+            models.Index(fields=['status', 'available_copies']),
+            # Serves the default ordering and title-prefix searches;
+            # isbn (and Borrower.library_id) are unique=True and so
+            # already carry their own btrees
+            models.Index(fields=['title']),
+            # Status-filtered listings order by title; this lets the
+            # ORDER BY read straight off the index
+            models.Index(fields=['status', 'title']),
+        ]
+        constraints = [
+            # Enforced by the database so update()/bulk_update paths are
+            # covered too, with no per-save Python clamp
+            models.CheckConstraint(
+                check=Q(available_copies__lte=F('total_copies')),
+                name='available_le_total',
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
-    def save(self, *args, **kwargs):
-        # Ensure available_copies doesn't exceed total_copies
-        if self.available_copies > self.total_copies:
-            self.available_copies = self.total_copies
-        super().save(*args, **kwargs)
-
     @property
     def is_available(self):
         return self.available_copies > 0 and self.status == 'available'
 
 
+class BorrowerManager(models.Manager):
+    # __str__/full_name always walk to the user row, so join it by
+    # default instead of paying a lazy SELECT per instance
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
+
 class Borrower(models.Model):
     """Extended user model for library borrowers"""
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='borrower')
@@ -93,18 +121,45 @@ class Borrower(models.Model):
     is_active = models.BooleanField(default=True)
     max_books_allowed = models.IntegerField(default=5, validators=[MinValueValidator(1)])
 
+    objects = BorrowerManager()
+
     class Meta:
         ordering = ['user__last_name', 'user__first_name']
+        indexes = [
+            # The home/dashboard borrower counters filter on is_active
+            models.Index(fields=['is_active']),
+        ]
 
     def __str__(self):
         return f"{self.user.get_full_name()} ({self.library_id})"
 
-    @property
+    # Cached per instance; callers that list borrowers should pair this
+    # with select_related('user') so the first read is free too
+    @cached_property
     def full_name(self):
         return self.user.get_full_name() or self.user.username
 
+    @staticmethod
+    def borrow_count_annotation():
+        return models.Count(
+            'borrowings', filter=Q(borrowings__return_date__isnull=True)
+        )
+
+    @classmethod
+    def with_borrow_counts(cls):
+        """Queryset annotated with active_borrow_count.
+
+        List views should use this so current_borrowed_books /
+        can_borrow_more read the annotation instead of running a COUNT
+        query per borrower.
+        """
+        return cls.objects.annotate(active_borrow_count=cls.borrow_count_annotation())
+
     @property
     def current_borrowed_books(self):
+        annotated = getattr(self, 'active_borrow_count', None)
+        if annotated is not None:
+            return annotated
         return self.borrowings.filter(return_date__isnull=True).count()
 
     @property
@@ -112,6 +167,13 @@ class Borrower(models.Model):
         return self.current_borrowed_books < self.max_books_allowed
 
 
+class BorrowingManager(models.Manager):
+    # Same reasoning as BorrowerManager: __str__ and the overdue/fine
+    # displays read borrower.user and book on nearly every row
+    def get_queryset(self):
+        return super().get_queryset().select_related('borrower__user', 'book')
+
+
 class Borrowing(models.Model):
     """Book borrowing transactions"""
     borrower = models.ForeignKey(Borrower, on_delete=models.CASCADE, related_name='borrowings')
@@ -130,9 +192,27 @@ class Borrowing(models.Model):
     )
     notes = models.TextField(blank=True)
 
+    objects = BorrowingManager()
+
     class Meta:
         ordering = ['-borrow_date']
         unique_together = ['borrower', 'book', 'borrow_date']
+        indexes = [
+            # Active/overdue scans filter on return_date + due_date
+            models.Index(fields=['return_date', 'due_date']),
+            # current_borrowed_books counts per borrower where not returned
+            models.Index(fields=['borrower', 'return_date']),
+            # Recent-activity listings and day-range lookups scan by
+            # borrow_date; keep them off the table scan path
+            models.Index(fields=['borrow_date']),
+            # Overdue checks only ever look at unreturned rows, so a
+            # partial index on due_date stays tiny
+            models.Index(
+                fields=['due_date'],
+                name='brw_overdue_idx',
+                condition=Q(return_date__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.borrower.full_name} - {self.book.title}"
@@ -141,42 +221,76 @@ class Borrowing(models.Model):
         # Set due date to 14 days from borrow date if not set
         if not self.due_date:
             self.due_date = timezone.now() + timedelta(days=14)
-        
-        # Update book availability
-        if self.pk is None:  # New borrowing
-            self.book.available_copies -= 1
-            if self.book.available_copies == 0:
-                self.book.status = 'borrowed'
-            self.book.save()
-        elif self.return_date and not self._state.adding:  # Book returned
-            if self.status == 'borrowed':
-                self.book.available_copies += 1
-                if self.book.status == 'borrowed':
-                    self.book.status = 'available'
-                self.book.save()
-                self.status = 'returned'
-
         super().save(*args, **kwargs)
 
-    @property
+    @staticmethod
+    def claim_copy(book):
+        """Atomically take one available copy of a book.
+
+        The conditional UPDATE only succeeds while copies remain, so
+        concurrent borrows cannot drive the counter negative. Returns
+        whether a copy was claimed.
+        """
+        return bool(
+            Book.objects.filter(pk=book.pk, available_copies__gt=0).update(
+                available_copies=F('available_copies') - 1,
+                status=Case(
+                    When(available_copies=1, then=Value('borrowed')),
+                    default=F('status'),
+                ),
+            )
+        )
+
+    @staticmethod
+    def release_copy(book_id):
+        """Put one copy of a book back into circulation."""
+        Book.objects.filter(pk=book_id).update(
+            available_copies=F('available_copies') + 1,
+            status=Case(
+                When(status='borrowed', then=Value('available')),
+                default=F('status'),
+            ),
+        )
+
+    @classmethod
+    def create_for(cls, borrower, book, notes=''):
+        """Borrow a book: claim a copy and create the record."""
+        with transaction.atomic():
+            if not cls.claim_copy(book):
+                raise ValidationError(f'No available copies of "{book.title}".')
+            return cls.objects.create(borrower=borrower, book=book, notes=notes)
+
+    def mark_returned(self, notes=None):
+        """Return a book: release the copy and close the record."""
+        if self.return_date is not None:
+            return
+        self.return_date = timezone.now()
+        self.status = 'returned'
+        if notes is not None:
+            self.notes = notes
+        with transaction.atomic():
+            self.release_copy(self.book_id)
+            self.save(update_fields=['return_date', 'status', 'notes'])
+
+    # Cached per instance: admin and dashboard pages read these several
+    # times per row, so compute the date arithmetic only once
+    @cached_property
     def is_overdue(self):
         return timezone.now() > self.due_date and self.return_date is None
 
-    @property
+    @cached_property
     def days_overdue(self):
         if self.is_overdue:
             return (timezone.now() - self.due_date).days
         return 0
 
-    @property
+    @cached_property
     def fine_amount(self):
-        if self.is_overdue:
-            days = self.days_overdue
-            daily_rate = getattr(settings, 'DAILY_FINE_RATE', 5.0)
-            max_days = getattr(settings, 'MAX_FINE_DAYS', 30)
-            days_to_charge = min(days, max_days)
-            return days_to_charge * daily_rate
-        return 0
+        now = timezone.now()
+        if self.return_date is not None or now <= self.due_date:
+            return 0
+        days_to_charge = min((now - self.due_date).days, _MAX_FINE_DAYS)
+        return days_to_charge * _DAILY_FINE_RATE
 
 
 class Fine(models.Model):
@@ -196,6 +310,19 @@ class Fine(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # The admin bulk actions and pending-fine aggregates all
+            # filter on status='pending'; a partial index keeps those
+            # proportional to the pending rows only
+            models.Index(
+                fields=['status'],
+                name='fine_pending_idx',
+                condition=Q(status='pending'),
+            ),
+            # The fine aggregates sum amount grouped by status; this
+            # makes them index-only scans
+            models.Index(fields=['status', 'amount']),
+        ]
 
     def __str__(self):
         return f"Fine: ${self.amount} - {self.borrowing}"
@@ -233,6 +360,15 @@ class Reservation(models.Model):
     class Meta:
         ordering = ['request_date']
         unique_together = ['borrower', 'book', 'request_date']
+        indexes = [
+            models.Index(
+                fields=['status'],
+                name='reservation_pending_idx',
+                condition=Q(status='pending'),
+            ),
+            # Expiry sweeps filter pending reservations by expiry_date
+            models.Index(fields=['status', 'expiry_date']),
+        ]
 
     def __str__(self):
         return f"{self.borrower.full_name} - {self.book.title}"
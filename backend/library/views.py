@@ -1,16 +1,21 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.core.exceptions import EmptyResultSet, ValidationError
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth import login
 from django.contrib import messages
 from django.http import JsonResponse
 from django.views.generic import ListView, DetailView, CreateView, UpdateView
 from django.urls import reverse_lazy, reverse
-from django.db.models import Q, Count, Sum
+from django.db.models import Exists, OuterRef, Prefetch, Q, Count, Sum, Value
+from django.db.models.functions import Concat
 from django.utils import timezone
 from datetime import timedelta
+from django.core.cache import cache
 from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from django.contrib.auth.models import User
+import hashlib
 
 from .models import (
     Book, Borrower, Borrowing, Fine, Category, Author, Reservation
@@ -21,22 +26,102 @@ from .forms import (
 )
 
 
-def home(request):
-    """Home page with library statistics"""
-    context = {
+# All book search entry points build their predicate here so there is a
+# single place to swap the LIKE scans for real full-text search (a
+# SearchVectorField + GIN index) if the project ever moves to Postgres;
+# SQLite offers neither, so icontains is the best this backend can do.
+BOOK_SEARCH_FIELDS = ('title', 'isbn', 'publisher')
+# Matched from the Author side (see BookListView's EXISTS subquery)
+AUTHOR_SEARCH_FIELDS = ('first_name', 'last_name')
+
+
+def book_search_q(query, fields=BOOK_SEARCH_FIELDS):
+    q = Q()
+    for field in fields:
+        q |= Q(**{f'{field}__icontains': query})
+    return q
+
+
+def get_borrower(request):
+    """Return the user's borrower profile (or None), cached per request.
+
+    Nearly every authenticated view resolves request.user.borrower;
+    caching it on the request means one SELECT no matter how many
+    call sites run.
+    """
+    if not hasattr(request, '_borrower'):
+        try:
+            request._borrower = request.user.borrower
+        except (Borrower.DoesNotExist, AttributeError):
+            # AttributeError covers AnonymousUser
+            request._borrower = None
+    return request._borrower
+
+
+class CachingPaginator(Paginator):
+    """Paginator that memoizes COUNT(*) per filter in the cache.
+
+    Every pagination click re-runs the same count against the same
+    filtered queryset; keying on the generated SQL shares the result
+    across requests for the lifetime of the (short) TTL.
+    """
+    count_timeout = 60
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            # Plain sequences are already in memory
+            return len(self.object_list)
+        try:
+            key = 'paginator_count:' + hashlib.md5(str(query).encode()).hexdigest()
+        except EmptyResultSet:
+            # .none() querysets (e.g. search_books with an invalid form)
+            # have no SQL to key on -- and no rows
+            return 0
+        count = cache.get(key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(key, count, self.count_timeout)
+        return count
+
+
+def _home_stats():
+    borrowing_stats = Borrowing.objects.aggregate(
+        currently_borrowed=Count('pk', filter=Q(return_date__isnull=True)),
+        overdue_books=Count(
+            'pk', filter=Q(return_date__isnull=True, due_date__lt=timezone.now())
+        ),
+    )
+    return {
         'total_books': Book.objects.count(),
         'total_borrowers': Borrower.objects.filter(is_active=True).count(),
-        'currently_borrowed': Borrowing.objects.filter(return_date__isnull=True).count(),
-        'overdue_books': Borrowing.objects.filter(
-            return_date__isnull=True,
-            due_date__lt=timezone.now()
-        ).count(),
+        **borrowing_stats,
         'total_fines': Fine.objects.filter(status='pending').aggregate(
             total=Sum('amount')
         )['total'] or 0,
-        'recent_books': Book.objects.order_by('-created_at')[:5],
-        'recent_borrowings': Borrowing.objects.order_by('-borrow_date')[:5],
+        # Materialized with list() so the cached value is the rows, not a
+        # lazy queryset; only() keeps the 5-item listings narrow
+        'recent_books': list(
+            Book.objects.order_by('-created_at')
+            .only('title', 'cover_image', 'status', 'available_copies')
+            .prefetch_related('authors')[:5]
+        ),
+        'recent_borrowings': list(
+            Borrowing.objects.order_by('-borrow_date').only(
+                'borrow_date', 'status', 'book__title',
+                'borrower__user__first_name', 'borrower__user__last_name',
+                'borrower__user__username',
+            )[:5]
+        ),
     }
+
+
+def home(request):
+    """Home page with library statistics"""
+    # The two borrowing counters share one aggregate, and the whole
+    # context tolerates 30s of staleness, so serve it from the cache
+    context = cache.get_or_set('home_stats', _home_stats, 30)
     return render(request, 'library/home.html', context)
 
 
@@ -58,9 +143,8 @@ def register_view(request):
 @login_required
 def profile_view(request):
     """User profile view"""
-    try:
-        borrower = request.user.borrower
-    except Borrower.DoesNotExist:
+    borrower = get_borrower(request)
+    if borrower is None:
         messages.error(request, 'You need a borrower profile to access this page.')
         return redirect('library:home')
 
@@ -82,6 +166,7 @@ class BookListView(ListView):
     template_name = 'library/books.html'
     context_object_name = 'books'
     paginate_by = 12
+    paginator_class = CachingPaginator
 
     def get_queryset(self):
         queryset = Book.objects.select_related('category').prefetch_related('authors')
@@ -90,13 +175,15 @@ class BookListView(ListView):
         status_filter = self.request.GET.get('status', '')
 
         if search_query:
+            # Author matches run as an EXISTS semi-join, so the main
+            # query never fans out over the M2M and needs no DISTINCT
+            author_match = Author.objects.filter(
+                book_search_q(search_query, AUTHOR_SEARCH_FIELDS),
+                books=OuterRef('pk'),
+            )
             queryset = queryset.filter(
-                Q(title__icontains=search_query) |
-                Q(isbn__icontains=search_query) |
-                Q(authors__first_name__icontains=search_query) |
-                Q(authors__last_name__icontains=search_query) |
-                Q(publisher__icontains=search_query)
-            ).distinct()
+                book_search_q(search_query) | Q(Exists(author_match))
+            )
 
         if category_filter:
             queryset = queryset.filter(category_id=category_filter)
@@ -104,7 +191,12 @@ class BookListView(ListView):
         if status_filter:
             queryset = queryset.filter(status=status_filter)
 
-        return queryset.order_by('title')
+        # The card grid never shows description or pricing; keep the
+        # SELECT to the columns the template actually renders
+        return queryset.only(
+            'title', 'isbn', 'publisher', 'publication_year', 'cover_image',
+            'status', 'available_copies', 'total_copies', 'category__name',
+        ).order_by('title')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -120,39 +212,48 @@ class BookDetailView(DetailView):
     template_name = 'library/book_detail.html'
     context_object_name = 'book'
 
+    def get_queryset(self):
+        queryset = Book.objects.select_related('category').prefetch_related('authors')
+        if self.request.user.is_authenticated:
+            # Computed in the same SELECT as the book itself, replacing a
+            # separate reservations EXISTS query per request
+            queryset = queryset.annotate(
+                user_has_reservation=Exists(
+                    Reservation.objects.filter(
+                        book=OuterRef('pk'),
+                        borrower__user=self.request.user,
+                        status='pending',
+                    )
+                )
+            )
+        return queryset
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        book = self.get_object()
-        
+        # get() already resolved the object; re-calling get_object()
+        # would run the detail SELECT a second time
+        book = self.object
+
         # Check if current user can borrow this book
         can_borrow = False
-        if self.request.user.is_authenticated:
-            try:
-                borrower = self.request.user.borrower
-                can_borrow = (
-                    borrower.can_borrow_more and 
-                    book.is_available and 
-                    borrower.is_active
-                )
-            except Borrower.DoesNotExist:
-                pass
+        borrower = get_borrower(self.request)
+        if borrower is not None:
+            can_borrow = (
+                borrower.can_borrow_more and
+                book.is_available and
+                borrower.is_active
+            )
 
         context.update({
             'can_borrow': can_borrow,
-            'recent_borrowings': book.borrowings.order_by('-borrow_date')[:5],
-            'has_reservation': False,
+            'recent_borrowings': book.borrowings.only(
+                'borrow_date', 'due_date', 'return_date', 'status',
+                'book__title', 'borrower__user__first_name',
+                'borrower__user__last_name', 'borrower__user__username',
+            ).order_by('-borrow_date')[:5],
+            'has_reservation': getattr(book, 'user_has_reservation', False),
         })
 
-        # Check if user has a pending reservation for this book
-        if self.request.user.is_authenticated:
-            try:
-                borrower = self.request.user.borrower
-                context['has_reservation'] = borrower.reservations.filter(
-                    book=book, status='pending'
-                ).exists()
-            except Borrower.DoesNotExist:
-                pass
-
         return context
 
 
@@ -161,9 +262,8 @@ def borrow_book(request, book_id):
     """Handle book borrowing"""
     book = get_object_or_404(Book, id=book_id)
     
-    try:
-        borrower = request.user.borrower
-    except Borrower.DoesNotExist:
+    borrower = get_borrower(request)
+    if borrower is None:
         messages.error(request, 'You need a borrower profile to borrow books.')
         return redirect('library:home')
 
@@ -181,10 +281,13 @@ def borrow_book(request, book_id):
                 return redirect('library:book_detail', book_id=book.id)
 
             # Create borrowing record
-            borrowing = form.save(commit=False)
-            borrowing.borrower = borrower
-            borrowing.book = book
-            borrowing.save()
+            try:
+                borrowing = Borrowing.create_for(
+                    borrower, book, notes=form.cleaned_data.get('notes', '')
+                )
+            except ValidationError:
+                messages.error(request, 'This book is not available for borrowing.')
+                return redirect('library:book_detail', book_id=book.id)
 
             messages.success(request, f'Successfully borrowed "{book.title}". Due date: {borrowing.due_date.strftime("%Y-%m-%d")}')
             return redirect('library:my_borrowings')
@@ -202,31 +305,25 @@ def borrow_book(request, book_id):
 @login_required
 def my_borrowings(request):
     """Display current user's borrowings"""
-    try:
-        borrower = request.user.borrower
-        borrowings = borrower.borrowings.select_related('book').order_by('-borrow_date')
-        
-        # Separate current and past borrowings
-        current_borrowings = borrowings.filter(return_date__isnull=True)
-        past_borrowings = borrowings.filter(return_date__isnull=False)
-        
-        # Check for overdue books and create fines
-        for borrowing in current_borrowings:
-            if borrowing.is_overdue and not hasattr(borrowing, 'fine'):
-                fine_amount = borrowing.fine_amount
-                if fine_amount > 0:
-                    Fine.objects.create(
-                        borrowing=borrowing,
-                        amount=fine_amount
-                    )
+    borrower = get_borrower(request)
+    if borrower is not None:
+        # Fine accrual happens in the accrue_fines management command,
+        # not on page view; this is a pure read. One capped fetch serves
+        # both lists, partitioned in Python, instead of a SELECT per
+        # list; 'fine' rides along on the JOIN for the overdue display.
+        rows = list(
+            borrower.borrowings.select_related('fine')
+            .prefetch_related('book__authors')
+            .order_by('-borrow_date')[:200]
+        )
+        current_borrowings = [b for b in rows if b.return_date is None]
+        past_borrowings = [b for b in rows if b.return_date is not None]
 
         paginator = Paginator(current_borrowings, 10)
         page_number = request.GET.get('page')
         current_page = paginator.get_page(page_number)
-
-    except Borrower.DoesNotExist:
-        current_borrowings = Borrowing.objects.none()
-        past_borrowings = Borrowing.objects.none()
+    else:
+        past_borrowings = []
         current_page = None
 
     return render(request, 'library/my_borrowings.html', {
@@ -249,18 +346,9 @@ def return_book(request, borrowing_id):
         form = ReturnBookForm(request.POST, instance=borrowing)
         if form.is_valid():
             borrowing = form.save(commit=False)
-            borrowing.return_date = timezone.now()
-            borrowing.status = 'returned'
-            borrowing.save()
-
-            # Update book availability
-            book = borrowing.book
-            book.available_copies += 1
-            if book.status == 'borrowed':
-                book.status = 'available'
-            book.save()
-
-            messages.success(request, f'Successfully returned "{book.title}".')
+            borrowing.mark_returned()
+
+            messages.success(request, f'Successfully returned "{borrowing.book.title}".')
             return redirect('library:my_borrowings')
 
     else:
@@ -278,9 +366,8 @@ def reserve_book(request, book_id):
     """Handle book reservation"""
     book = get_object_or_404(Book, id=book_id)
     
-    try:
-        borrower = request.user.borrower
-    except Borrower.DoesNotExist:
+    borrower = get_borrower(request)
+    if borrower is None:
         messages.error(request, 'You need a borrower profile to reserve books.')
         return redirect('library:book_detail', book_id=book.id)
 
@@ -314,10 +401,10 @@ def reserve_book(request, book_id):
 @login_required
 def my_reservations(request):
     """Display current user's reservations"""
-    try:
-        borrower = request.user.borrower
+    borrower = get_borrower(request)
+    if borrower is not None:
         reservations = borrower.reservations.select_related('book').order_by('-request_date')
-    except Borrower.DoesNotExist:
+    else:
         reservations = Reservation.objects.none()
 
     return render(request, 'library/my_reservations.html', {
@@ -348,16 +435,20 @@ def cancel_reservation(request, reservation_id):
 @login_required
 def my_fines(request):
     """Display current user's fines"""
-    try:
-        borrower = request.user.borrower
+    borrower = get_borrower(request)
+    if borrower is not None:
         fines = Fine.objects.filter(
             borrowing__borrower=borrower
         ).select_related('borrowing__book').order_by('-created_at')
-        
-        total_fines = fines.aggregate(total=Sum('amount'))['total'] or 0
-        pending_fines = fines.filter(status='pending').aggregate(total=Sum('amount'))['total'] or 0
-        
-    except Borrower.DoesNotExist:
+
+        # Both totals come from one scan via a conditional Sum
+        stats = fines.aggregate(
+            total=Sum('amount'),
+            pending=Sum('amount', filter=Q(status='pending')),
+        )
+        total_fines = stats['total'] or 0
+        pending_fines = stats['pending'] or 0
+    else:
         fines = Fine.objects.none()
         total_fines = 0
         pending_fines = 0
@@ -382,27 +473,24 @@ def search_books(request):
         books = Book.objects.select_related('category').prefetch_related('authors')
         
         if search_query:
-            books = books.filter(
-                Q(title__icontains=search_query) |
-                Q(isbn__icontains=search_query) |
-                Q(publisher__icontains=search_query)
-            )
+            books = books.filter(book_search_q(search_query))
         
         if category:
-            books = books.filter(category=category)
-            
+            books = books.filter(category_id=category)
+
         if author:
-            books = books.filter(authors=author)
+            books = books.filter(authors__id=author)
 
-    # Paginate results
-    paginator = Paginator(books, 12)
+    # Paginate results; the paginator's cached count doubles as the
+    # results total, so no second COUNT query
+    paginator = CachingPaginator(books, 12)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
 
     return render(request, 'library/search.html', {
         'form': form,
         'books': page_obj,
-        'results_count': books.count() if form.is_valid() else 0,
+        'results_count': paginator.count,
     })
 
 
@@ -419,16 +507,25 @@ def dashboard(request):
     week_ago = today - timedelta(days=7)
     month_ago = today - timedelta(days=30)
 
+    # The listings only render a handful of columns, so defer the rest
+    borrowing_row_fields = (
+        'borrow_date', 'due_date', 'return_date', 'status', 'book__title',
+        'borrower__user__first_name', 'borrower__user__last_name',
+        'borrower__user__username',
+    )
+
     context = {
         # Basic statistics
         'total_books': Book.objects.count(),
         'total_borrowers': Borrower.objects.filter(is_active=True).count(),
         'active_borrowings': Borrowing.objects.filter(return_date__isnull=True).count(),
-        'overdue_borrowings': Borrowing.objects.filter(
+        # Named separately from the listing below; the old
+        # 'overdue_borrowings' count was silently overwritten by it
+        'overdue_count': Borrowing.objects.filter(
             return_date__isnull=True,
             due_date__lt=timezone.now()
         ).count(),
-        
+
         # Recent activity
         'recent_borrowings': Borrowing.objects.filter(
             borrow_date__gte=week_ago
@@ -436,25 +533,25 @@ def dashboard(request):
         'recent_returns': Borrowing.objects.filter(
             return_date__gte=week_ago
         ).count(),
-        
+
         # Fines
         'total_fines': Fine.objects.aggregate(total=Sum('amount'))['total'] or 0,
         'pending_fines': Fine.objects.filter(status='pending').aggregate(total=Sum('amount'))['total'] or 0,
-        
-        # Popular books
+
+        # Popular books; the template renders category/authors per row
         'popular_books': Book.objects.annotate(
             borrow_count=Count('borrowings')
-        ).order_by('-borrow_count')[:10],
-        
+        ).select_related('category').prefetch_related('authors').order_by('-borrow_count')[:10],
+
         # Overdue books
         'overdue_borrowings': Borrowing.objects.filter(
             return_date__isnull=True,
             due_date__lt=timezone.now()
-        ).select_related('borrower__user', 'book').order_by('due_date'),
-        
+        ).only(*borrowing_row_fields).order_by('due_date'),
+
         # Recent activity
-        'recent_activity': Borrowing.objects.select_related(
-            'borrower__user', 'book'
+        'recent_activity': Borrowing.objects.only(
+            *borrowing_row_fields
         ).order_by('-borrow_date')[:10],
     }
 
@@ -463,24 +560,39 @@ def dashboard(request):
 
 def api_book_search(request):
     """API endpoint for AJAX book search"""
-    query = request.GET.get('q', '')
+    query = request.GET.get('q', '').strip()
     if len(query) < 2:
         return JsonResponse({'books': []})
 
-    books = Book.objects.filter(
-        Q(title__icontains=query) |
-        Q(isbn__icontains=query)
-    )[:10]
-
-    results = []
-    for book in books:
-        results.append({
-            'id': book.id,
-            'title': book.title,
-            'isbn': book.isbn,
-            'authors': [author.full_name for author in book.authors.all()],
-            'available': book.is_available,
-            'url': reverse('library:book_detail', args=[book.id])
-        })
-
-    return JsonResponse({'books': results})
+    # Typeahead traffic repeats the same prefixes on every keystroke;
+    # a short-TTL cache keyed on the normalized query absorbs most hits
+    key = 'bsearch:' + hashlib.md5(query.lower().encode()).hexdigest()
+    payload = cache.get(key)
+    if payload is None:
+        # One IN-query for all authors instead of one per result row,
+        # and only the columns the JSON payload uses. The name is glued
+        # together in SQL; a GeneratedField would persist it but needs
+        # Django 5, which this project does not target yet.
+        authors_with_name = Author.objects.annotate(
+            name=Concat('first_name', Value(' '), 'last_name')
+        ).only('first_name', 'last_name')
+        books = Book.objects.filter(
+            book_search_q(query, ('title', 'isbn'))
+        ).prefetch_related(
+            Prefetch('authors', queryset=authors_with_name)
+        ).only('id', 'title', 'isbn', 'status', 'available_copies')[:10]
+
+        payload = {'books': [
+            {
+                'id': book.id,
+                'title': book.title,
+                'isbn': book.isbn,
+                'authors': [author.name for author in book.authors.all()],
+                'available': book.is_available,
+                'url': reverse('library:book_detail', args=[book.id]),
+            }
+            for book in books
+        ]}
+        cache.set(key, payload, 60)
+
+    return JsonResponse(payload)
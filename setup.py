@@ -6,15 +6,29 @@ import os
 import sys
 import subprocess
 
-def run_command(command, description):
-    """Run a command and handle errors"""
+def run_command(argv, description):
+    """Run a command, streaming its output, and handle errors"""
     print(f"\n{description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        # argv list instead of shell=True: no /bin/sh fork or quoting
+        # issues, and streaming the output line by line shows progress
+        # for long steps instead of buffering it all in memory
+        process = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        for line in process.stdout:
+            print(line, end='')
+        if process.wait() != 0:
+            print(f"✗ {description} failed (exit code {process.returncode})")
+            return False
         print(f"✓ {description} completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ {description} failed: {e.stderr}")
+    except OSError as e:
+        print(f"✗ {description} failed: {e}")
         return False
 
 def main():
@@ -31,36 +45,38 @@ def main():
     os.chdir('backend')
     
     # Install dependencies
-    if not run_command('pip install -r requirements.txt', 'Installing dependencies'):
+    if not run_command([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'],
+                       'Installing dependencies'):
         print("✗ Failed to install dependencies. Please check your Python environment.")
         sys.exit(1)
-    
+
     # Run migrations
-    if not run_command('python manage.py makemigrations', 'Creating database migrations'):
+    if not run_command([sys.executable, 'manage.py', 'makemigrations'],
+                       'Creating database migrations'):
         print("✗ Failed to create migrations")
         sys.exit(1)
-    
-    if not run_command('python manage.py migrate', 'Applying database migrations'):
+
+    if not run_command([sys.executable, 'manage.py', 'migrate'],
+                       'Applying database migrations'):
         print("✗ Failed to apply migrations")
         sys.exit(1)
-    
+
     # Create superuser
     print("\n📝 Creating superuser account...")
     print("Please enter the following information for your admin account:")
-    
+
     # Try to create superuser non-interactively first
-    create_superuser_cmd = """
-python manage.py shell << EOF
-from django.contrib.auth.models import User
-if not User.objects.filter(username='admin').exists():
-    User.objects.create_superuser('admin', 'admin@example.com', 'admin123')
-    print('Superuser created successfully!')
-else:
-    print('Superuser already exists!')
-EOF
-"""
-    
-    if run_command(create_superuser_cmd, 'Creating superuser'):
+    create_superuser_code = (
+        "from django.contrib.auth.models import User\n"
+        "if not User.objects.filter(username='admin').exists():\n"
+        "    User.objects.create_superuser('admin', 'admin@example.com', 'admin123')\n"
+        "    print('Superuser created successfully!')\n"
+        "else:\n"
+        "    print('Superuser already exists!')\n"
+    )
+
+    if run_command([sys.executable, 'manage.py', 'shell', '-c', create_superuser_code],
+                   'Creating superuser'):
         print("✓ Superuser created: username='admin', password='admin123'")
     else:
         print("⚠️  Could not create superuser automatically. Please create it manually:")
@@ -68,14 +84,16 @@ EOF
     
     # Populate sample data
     print("\n📚 Populating sample data...")
-    if run_command('python manage.py populate_sample_data', 'Loading sample data'):
+    if run_command([sys.executable, 'manage.py', 'populate_sample_data'],
+                   'Loading sample data'):
         print("✓ Sample data loaded successfully")
     else:
         print("⚠️  Could not load sample data. You can do it manually later:")
         print("   python manage.py populate_sample_data")
     
     # Collect static files
-    if not run_command('python manage.py collectstatic --noinput', 'Collecting static files'):
+    if not run_command([sys.executable, 'manage.py', 'collectstatic', '--noinput'],
+                       'Collecting static files'):
         print("⚠️  Failed to collect static files. This might cause issues in production.")
     
     print("\n" + "=" * 50)